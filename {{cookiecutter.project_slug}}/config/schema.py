@@ -0,0 +1,32 @@
+from typing import Any
+from typing import ClassVar
+
+from django.utils.translation import get_language
+from drf_spectacular.generators import SchemaGenerator
+
+
+class CachedSchemaGenerator(SchemaGenerator):
+    """
+    Schema generator that keeps the public OpenAPI schema in process memory.
+
+    The schema only depends on the code being served, so it is built once per
+    worker for each URL conf, API version and language. Keeping it in memory
+    rather than in the shared cache means a deploy, which restarts the workers,
+    always serves the new schema. Non-public schemas are filtered by the
+    requesting user's permissions and are never cached.
+    """
+
+    _schemas: ClassVar[dict[tuple, Any]] = {}
+
+    def get_schema(self, request=None, public=False):  # noqa: FBT002
+        if not public:
+            return super().get_schema(request=request, public=public)
+        key = (
+            self.urlconf,
+            tuple(self.patterns or ()),
+            self.api_version,
+            get_language(),
+        )
+        if key not in self._schemas:
+            self._schemas[key] = super().get_schema(request=request, public=public)
+        return self._schemas[key]
@@ -31,6 +31,11 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["{{ cookiecutter.domai
 # DATABASES
 # ------------------------------------------------------------------------------
 DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+# https://docs.djangoproject.com/en/dev/ref/databases/#persistent-database-connections
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool(
+    "CONN_HEALTH_CHECKS",
+    default=True,
+)
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -43,9 +48,22 @@ CACHES = {
             # Mimicing memcache behavior.
             # https://github.com/jazzband/django-redis#memcached-exceptions-behavior
             "IGNORE_EXCEPTIONS": True,
+            # https://github.com/jazzband/django-redis#pluggable-parsers
+            "PARSER_CLASS": "redis.connection._HiredisParser",
+            # https://github.com/jazzband/django-redis#connection-pools
+            "CONNECTION_POOL_CLASS": "redis.connection.BlockingConnectionPool",
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": env.int("REDIS_MAX_CONNECTIONS", default=100),
+                "timeout": env.float("REDIS_POOL_TIMEOUT", default=5.0),
+                "retry_on_timeout": True,
+            },
         },
     },
 }
+# https://docs.djangoproject.com/en/dev/ref/settings/#session-engine
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+# https://docs.djangoproject.com/en/dev/ref/settings/#session-cache-alias
+SESSION_CACHE_ALIAS = "default"
 
 # SECURITY
 # ------------------------------------------------------------------------------
@@ -8,11 +8,16 @@ from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import include
 from django.urls import path
 from django.views import defaults as default_views
+{%- if cookiecutter.use_drf == 'y' %}
+from django.views.decorators.gzip import gzip_page
+{%- endif %}
 from django.views.generic import TemplateView
 {%- if cookiecutter.use_drf == 'y' %}
 from drf_spectacular.views import SpectacularAPIView
 from drf_spectacular.views import SpectacularSwaggerView
 from rest_framework.authtoken.views import obtain_auth_token
+
+from config.schema import CachedSchemaGenerator
 {%- endif %}
 
 urlpatterns = [
@@ -44,7 +49,11 @@ urlpatterns += [
     path("api/", include("config.api_router")),
     # DRF auth token
     path("api/auth-token/", obtain_auth_token),
-    path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
+    path(
+        "api/schema/",
+        gzip_page(SpectacularAPIView.as_view(generator_class=CachedSchemaGenerator)),
+        name="api-schema",
+    ),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="api-schema"),
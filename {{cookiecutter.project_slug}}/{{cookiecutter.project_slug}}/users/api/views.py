@@ -22,7 +22,8 @@ class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericV
 
     def get_queryset(self, *args, **kwargs):
         assert isinstance(self.request.user.id, int)
-        return self.queryset.filter(id=self.request.user.id)
+        fields = [f for f in self.serializer_class.Meta.fields if f != "url"]
+        return self.queryset.filter(id=self.request.user.id).only(*fields)
 
     @action(detail=False)
     def me(self, request):
@@ -1,5 +1,6 @@
 import pytest
 from rest_framework.test import APIRequestFactory
+from rest_framework.test import force_authenticate
 
 from {{ cookiecutter.project_slug }}.users.api.views import UserViewSet
 from {{ cookiecutter.project_slug }}.users.models import User
@@ -37,3 +38,37 @@ class TestUserViewSet:
             {%- endif %}
             "name": user.name,
         }
+
+    def test_list_runs_single_query(
+        self,
+        user: User,
+        api_rf: APIRequestFactory,
+        django_assert_num_queries,
+    ):
+        view = UserViewSet.as_view({"get": "list"})
+        request = api_rf.get("/fake-url/")
+        force_authenticate(request, user=user)
+
+        with django_assert_num_queries(1):
+            response = view(request)
+
+        assert response.data[0]["name"] == user.name
+
+    def test_retrieve_runs_single_query(
+        self,
+        user: User,
+        api_rf: APIRequestFactory,
+        django_assert_num_queries,
+    ):
+        view = UserViewSet.as_view({"get": "retrieve"})
+        request = api_rf.get("/fake-url/")
+        force_authenticate(request, user=user)
+
+        with django_assert_num_queries(1):
+            {%- if cookiecutter.username_type == "email" %}
+            response = view(request, pk=user.pk)
+            {%- else %}
+            response = view(request, username=user.username)
+            {%- endif %}
+
+        assert response.data["name"] == user.name
@@ -1,7 +1,11 @@
 from http import HTTPStatus
+from unittest import mock
 
 import pytest
 from django.urls import reverse
+from drf_spectacular.generators import SchemaGenerator
+
+from config.schema import CachedSchemaGenerator
 
 
 def test_swagger_accessible_by_admin(admin_client):
@@ -21,3 +25,36 @@ def test_api_schema_generated_successfully(admin_client):
     url = reverse("api-schema")
     response = admin_client.get(url)
     assert response.status_code == HTTPStatus.OK
+
+
+def test_api_schema_gzipped(admin_client):
+    url = reverse("api-schema")
+    response = admin_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Encoding"] == "gzip"
+
+
+def test_api_schema_served_from_cache(admin_client):
+    url = reverse("api-schema")
+    CachedSchemaGenerator._schemas.clear()  # noqa: SLF001
+    admin_client.get(url)
+    with mock.patch.object(SchemaGenerator, "get_schema") as get_schema:
+        response = admin_client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    get_schema.assert_not_called()
+
+
+def test_non_public_api_schema_not_cached():
+    generator = CachedSchemaGenerator()
+    with mock.patch.object(SchemaGenerator, "get_schema") as get_schema:
+        generator.get_schema(public=False)
+        generator.get_schema(public=False)
+    assert get_schema.call_args_list == [mock.call(request=None, public=False)] * 2
+
+
+def test_api_schema_cached_per_urlconf():
+    CachedSchemaGenerator._schemas.clear()  # noqa: SLF001
+    root = CachedSchemaGenerator(urlconf="config.urls")
+    api = CachedSchemaGenerator(urlconf="config.api_router")
+    with mock.patch.object(SchemaGenerator, "get_schema", side_effect=[{}, {}]):
+        assert root.get_schema(public=True) is not api.get_schema(public=True)